@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from .facebook_parser import FacebookPostsScraper
+from .utils_http import backoff_delay
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp is optional
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+class AsyncFacebookPostsScraper(FacebookPostsScraper):
+    """
+    asyncio variant of FacebookPostsScraper.
+
+    Pages are fetched concurrently over a shared aiohttp connection pool, while
+    HTML parsing is pushed to the default executor so CPU work doesn't stall
+    the event loop. Parsing and configuration are inherited unchanged.
+    """
+
+    CONNECTOR_LIMIT = 100
+    CONNECTOR_LIMIT_PER_HOST = 8
+    DNS_CACHE_TTL = 300
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for AsyncFacebookPostsScraper")
+        super().__init__(*args, **kwargs)
+
+    # ---------- Public API ----------
+
+    def create_session(self) -> "aiohttp.ClientSession":
+        connector = aiohttp.TCPConnector(
+            limit=self.CONNECTOR_LIMIT,
+            limit_per_host=self.CONNECTOR_LIMIT_PER_HOST,
+            ttl_dns_cache=self.DNS_CACHE_TTL,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def fetch_and_parse_async(
+        self, session: "aiohttp.ClientSession", url: str
+    ) -> List[Dict[str, Any]]:
+        posts = self._get_cached_posts(url)
+        if posts is None:
+            html = await self._fetch_html_with_retries_async(session, url)
+            if not html:
+                return []
+            loop = asyncio.get_running_loop()
+            posts = await loop.run_in_executor(None, self._parse_single_post_page, url, html)
+            self._cache_posts(url, posts)
+        return [post.to_dict() for post in posts]
+
+    # ---------- HTTP + Retry ----------
+
+    def _proxy_for(self, url: str) -> Optional[str]:
+        scheme = "https" if url.startswith("https:") else "http"
+        return self.session.proxies.get(scheme) or None
+
+    async def _wait_for_circuit_async(self, host: str) -> None:
+        waited = 0.0
+        while True:
+            delay = self._circuit_delay(host, waited)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+            waited += delay
+
+    async def _fetch_html_with_retries_async(
+        self, session: "aiohttp.ClientSession", url: str
+    ) -> Optional[str]:
+        host = self._breaker_host(url)
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, self.max_retries + 1):
+            await self._wait_for_circuit_async(host)
+            logger.info("Fetching URL (attempt %d/%d): %s", attempt, self.max_retries, url)
+            try:
+                async with session.get(url, proxy=self._proxy_for(url)) as response:
+                    last_error = self._record_attempt(host, url, attempt, status=response.status)
+                    if last_error is None:
+                        return await response.text(errors="replace")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                last_error = self._record_attempt(host, url, attempt, error=exc)
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(backoff_delay(self.backoff_factor, attempt))
+
+        logger.error("Failed to fetch %s after %d attempts: %s", url, self.max_retries, last_error)
+        return None
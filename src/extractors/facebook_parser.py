@@ -1,29 +1,138 @@
-import hashlib
+import functools
 import logging
+import re
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse, parse_qs
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
 
 import requests
+import xxhash
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+from .utils_http import CircuitBreaker, CircuitOpenError, HTTPStatusError, backoff_delay
 from .utils_time import now_timestamp
 
 logger = logging.getLogger(__name__)
 
+try:
+    import lxml.etree
+    import lxml.html
+
+    _BS4_FEATURES = "lxml"
+except ImportError:  # pragma: no cover - lxml is optional
+    lxml = None
+    _BS4_FEATURES = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - selectolax is optional
+    LexborHTMLParser = None
+
+try:
+    from cachetools import LRUCache
+except ImportError:  # pragma: no cover - cachetools is only needed for the result cache
+    LRUCache = None
+
+# A selectolax tree, an lxml.html root element or a BeautifulSoup tree, depending on the backend.
+HtmlTree = Union["LexborHTMLParser", "lxml.html.HtmlElement", BeautifulSoup]
+
+PARSER_BACKENDS = ("selectolax", "lxml", "bs4")
+
+# lxml parser objects must not be used from several threads at once, so each worker
+# thread keeps its own and reuses it for every page it parses.
+_LXML_PARSERS = threading.local()
+
+def _get_lxml_parser() -> "lxml.html.HTMLParser":
+    parser = getattr(_LXML_PARSERS, "parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(
+            recover=True,
+            remove_blank_text=True,
+            remove_comments=True,
+            encoding="utf-8",
+        )
+        _LXML_PARSERS.parser = parser
+    return parser
+
+def _is_lxml_tree(tree: HtmlTree) -> bool:
+    return lxml is not None and isinstance(tree, lxml.html.HtmlElement)
+
+# Tags whose contents are code or fallback markup rather than visible post text.
+_NON_CONTENT_TAGS = ("script", "style", "noscript")
+
+# Text nodes outside _NON_CONTENT_TAGS, for the lxml backend.
+_LXML_VISIBLE_TEXT = ".//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]"
+
+# Matches counts such as "1,234 comments" or "56 reactions" in the page text.
+_RE_ENGAGEMENT = re.compile(r"([\d,]+)\s+(comments?|likes?|reactions?|reacted)", re.IGNORECASE)
+
 @dataclass
 class AuthorInfo:
+    __slots__ = ("id", "name", "url")
+
     id: Optional[str]
     name: Optional[str]
     url: Optional[str]
 
 @dataclass
 class MediaInfo:
+    __slots__ = ("url",)
+
     url: Optional[str]
 
+@dataclass(frozen=True)
+class _ParsedUrl:
+    url: str
+    scheme: str
+    netloc: str
+    path_parts: Tuple[str, ...]
+    # Read-only view: instances are shared between callers through the lru_cache below.
+    query: Mapping[str, str]
+
+@functools.lru_cache(maxsize=1024)
+def _parse_url(url: str) -> Optional[_ParsedUrl]:
+    """
+    Split a URL once into the pieces the ID/author helpers need.
+    Cached because the same post and author URLs are looked up repeatedly.
+    """
+    try:
+        parts = urlsplit(url)
+        query_pairs = parse_qsl(parts.query)
+    except ValueError:
+        return None
+
+    query: Dict[str, str] = {}
+    for key, value in query_pairs:
+        # Keep the first value, as parse_qs(...)[key][0] would.
+        query.setdefault(key, value)
+
+    return _ParsedUrl(
+        url=url,
+        scheme=parts.scheme,
+        netloc=parts.netloc,
+        path_parts=tuple(p for p in parts.path.split("/") if p),
+        query=MappingProxyType(query),
+    )
+
 @dataclass
 class PostRecord:
+    __slots__ = (
+        "post_id",
+        "url",
+        "message",
+        "timestamp",
+        "comments_count",
+        "reactions_count",
+        "author",
+        "image",
+        "video",
+        "attached_post_url",
+    )
+
     post_id: Optional[str]
     url: str
     message: Optional[str]
@@ -36,12 +145,23 @@ class PostRecord:
     attached_post_url: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        # Ensure nested dataclasses are converted to dicts
-        data["author"] = asdict(self.author)
-        data["image"] = asdict(self.image)
-        data["video"] = asdict(self.video)
-        return data
+        # Built by hand: asdict() deep-copies every value, which is wasted work here.
+        return {
+            "post_id": self.post_id,
+            "url": self.url,
+            "message": self.message,
+            "timestamp": self.timestamp,
+            "comments_count": self.comments_count,
+            "reactions_count": self.reactions_count,
+            "author": {
+                "id": self.author.id,
+                "name": self.author.name,
+                "url": self.author.url,
+            },
+            "image": {"url": self.image.url},
+            "video": {"url": self.video.url},
+            "attached_post_url": self.attached_post_url,
+        }
 
 class FacebookPostsScraper:
     """
@@ -57,6 +177,7 @@ class FacebookPostsScraper:
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0 Safari/537.36"
     )
+    CIRCUIT_POLL_INTERVAL = 0.05
 
     def __init__(
         self,
@@ -65,10 +186,45 @@ class FacebookPostsScraper:
         backoff_factor: float = 0.5,
         user_agent: Optional[str] = None,
         proxies: Optional[Dict[str, str]] = None,
+        parser_backend: str = "selectolax",
+        max_workers: int = 4,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_recovery: float = 30.0,
+        circuit_breaker_max_wait: float = 120.0,
+        cache_size: int = 0,
     ) -> None:
+        if parser_backend not in PARSER_BACKENDS:
+            raise ValueError(
+                f"Unknown parser backend {parser_backend!r}; expected one of {PARSER_BACKENDS}"
+            )
+        if cache_size > 0 and LRUCache is None:
+            raise RuntimeError("cachetools is required when cache_size > 0")
+        if parser_backend == "selectolax" and LexborHTMLParser is None:
+            logger.warning("selectolax is not installed, falling back to the bs4 parser backend.")
+            parser_backend = "bs4"
+        elif parser_backend == "lxml" and lxml is None:
+            logger.warning("lxml is not installed, falling back to the bs4 parser backend.")
+            parser_backend = "bs4"
+
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.parser_backend = parser_backend
+        # Shared by all worker threads so a dead host is detected once, not per URL.
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=circuit_breaker_threshold,
+            recovery_window=circuit_breaker_recovery,
+        )
+        # How long one URL may wait for an open circuit before it is given up on.
+        self.circuit_breaker_max_wait = circuit_breaker_max_wait
+        # Optional LRU of parsed records per URL, off by default. It only pays off when one
+        # scraper instance is reused across calls that repeat URLs (e.g. a long-running
+        # embedder); the CLI dedupes its input and builds a fresh scraper per run.
+        # A per-instance LRUCache avoids lru_cache pinning `self`.
+        self._results_cache: Optional["LRUCache"] = (
+            LRUCache(maxsize=cache_size) if cache_size > 0 else None
+        )
+        self._results_cache_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -78,76 +234,195 @@ class FacebookPostsScraper:
         )
         if proxies:
             self.session.proxies.update(proxies)
+
+        # Size the keep-alive pool for the number of concurrent workers so threads
+        # don't block on pool checkout or open throwaway connections.
+        pool_size = max(1, max_workers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            pool_block=False,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         logger.debug(
-            "FacebookPostsScraper initialized (timeout=%s, max_retries=%s)",
+            "FacebookPostsScraper initialized (timeout=%s, max_retries=%s, parser=%s, pool=%s)",
             timeout,
             max_retries,
+            parser_backend,
+            pool_size,
         )
 
     # ---------- Public API ----------
 
-    def fetch_and_parse(self, url: str) -> List[Dict[str, Any]]:
-        html = self._fetch_html_with_retries(url)
-        if not html:
-            return []
-        posts = self._parse_single_post_page(url, html)
+    def fetch_and_parse(self, url: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse a single URL. With use_cache=False the result cache is neither
+        read nor filled, so nothing outlives the returned dicts.
+        """
+        posts = self._get_cached_posts(url) if use_cache else None
+        if posts is None:
+            html = self._fetch_html_with_retries(url)
+            if not html:
+                return []
+            posts = self._parse_single_post_page(url, html)
+            if use_cache:
+                self._cache_posts(url, posts)
         return [post.to_dict() for post in posts]
 
+    # ---------- Result Cache ----------
+
+    def _get_cached_posts(self, url: str) -> Optional[List[PostRecord]]:
+        if self._results_cache is None:
+            return None
+        with self._results_cache_lock:
+            posts = self._results_cache.get(url)
+        if posts is not None:
+            logger.debug("Using cached result for %s", url)
+        return posts
+
+    def _cache_posts(self, url: str, posts: List[PostRecord]) -> None:
+        if self._results_cache is None:
+            return
+        with self._results_cache_lock:
+            self._results_cache[url] = posts
+
     # ---------- HTTP + Retry ----------
 
+    @staticmethod
+    def _breaker_host(url: str) -> str:
+        # Malformed URLs (e.g. "http://[::1") still get a key; the fetch itself reports the error.
+        parsed_url = _parse_url(url)
+        return parsed_url.netloc if parsed_url else url
+
+    def _record_attempt(
+        self,
+        host: str,
+        url: str,
+        attempt: int,
+        status: Optional[int] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[Exception]:
+        """
+        Log one fetch attempt and record its outcome with the circuit breaker.
+
+        Pass the response `status`, or the `error` raised when no usable response
+        arrived. Returns the error to retry on, or None if the response can be used.
+        Shared by the sync and async fetch loops so both classify attempts identically.
+        """
+        if error is None and status is not None and status >= 500:
+            logger.warning("Received server error %s from %s", status, url)
+            self.circuit_breaker.record_failure(host)
+            return HTTPStatusError(status, url)
+
+        if error is None:
+            # Any non-5xx response means the host is up, so client errors don't trip the breaker.
+            self.circuit_breaker.record_success(host)
+            if status is None or status < 400:
+                return None
+            error = HTTPStatusError(status, url)
+        else:
+            self.circuit_breaker.record_failure(host)
+
+        logger.warning(
+            "Request error while fetching %s (attempt %d/%d): %s",
+            url,
+            attempt,
+            self.max_retries,
+            error,
+        )
+        return error
+
+    def _circuit_delay(self, host: str, waited: float) -> Optional[float]:
+        """
+        Return None if a request to `host` may go ahead now, otherwise how long to
+        sleep before asking the breaker again. Raises CircuitOpenError once the URL
+        has already waited `circuit_breaker_max_wait` seconds.
+        """
+        try:
+            self.circuit_breaker.before_request(host)
+        except CircuitOpenError as exc:
+            remaining = self.circuit_breaker_max_wait - waited
+            if remaining <= 0:
+                raise
+            if waited == 0:
+                logger.info("Circuit for %s is open, waiting up to %.1fs.", host, remaining)
+            # The floor keeps a rounding-sized retry_after from turning this into a busy loop.
+            return max(min(exc.retry_after, remaining), self.CIRCUIT_POLL_INTERVAL)
+        return None
+
+    def _wait_for_circuit(self, host: str) -> None:
+        waited = 0.0
+        while True:
+            delay = self._circuit_delay(host, waited)
+            if delay is None:
+                return
+            time.sleep(delay)
+            waited += delay
+
     def _fetch_html_with_retries(self, url: str) -> Optional[str]:
-        delay = self.backoff_factor
+        host = self._breaker_host(url)
         last_error: Optional[Exception] = None
 
         for attempt in range(1, self.max_retries + 1):
+            self._wait_for_circuit(host)
+            logger.info("Fetching URL (attempt %d/%d): %s", attempt, self.max_retries, url)
             try:
-                logger.info("Fetching URL (attempt %d/%d): %s", attempt, self.max_retries, url)
                 response = self.session.get(url, timeout=self.timeout)
-                if response.status_code >= 500:
-                    logger.warning(
-                        "Received server error %s from %s", response.status_code, url
-                    )
-                else:
-                    response.raise_for_status()
-                    return response.text
             except requests.RequestException as exc:
-                last_error = exc
-                logger.warning(
-                    "Request error while fetching %s (attempt %d/%d): %s",
-                    url,
-                    attempt,
-                    self.max_retries,
-                    exc,
-                )
-                if attempt < self.max_retries:
-                    time.sleep(delay)
-                    delay *= 2
+                last_error = self._record_attempt(host, url, attempt, error=exc)
+            else:
+                last_error = self._record_attempt(host, url, attempt, status=response.status_code)
+                if last_error is None:
+                    return response.text
+
+            if attempt < self.max_retries:
+                time.sleep(backoff_delay(self.backoff_factor, attempt))
 
         logger.error("Failed to fetch %s after %d attempts: %s", url, self.max_retries, last_error)
         return None
 
     # ---------- Parsing Logic ----------
 
+    def _build_tree(self, html: str) -> HtmlTree:
+        if self.parser_backend == "selectolax":
+            return LexborHTMLParser(html)
+        if self.parser_backend == "lxml":
+            # Fed as UTF-8 bytes so pages carrying an XML encoding declaration still parse.
+            try:
+                return lxml.html.document_fromstring(
+                    html.encode("utf-8"), parser=_get_lxml_parser()
+                )
+            except lxml.etree.ParserError:
+                # Whitespace- or comment-only pages; treat them as an empty document
+                # like the other backends do.
+                return lxml.html.Element("html")
+        return BeautifulSoup(html, _BS4_FEATURES)
+
     def _parse_single_post_page(self, url: str, html: str) -> List[PostRecord]:
-        soup = BeautifulSoup(html, "html.parser")
+        tree = self._build_tree(html)
 
-        og_title = self._get_meta_property(soup, "og:title")
-        og_description = self._get_meta_property(soup, "og:description")
-        og_site_name = self._get_meta_property(soup, "og:site_name")
-        og_url = self._get_meta_property(soup, "og:url") or url
-        og_image = self._get_meta_property(soup, "og:image")
-        og_video = self._get_meta_property(soup, "og:video")
+        meta = self._build_meta_index(tree)
+        og_title = meta.get("og:title")
+        og_description = meta.get("og:description")
+        og_site_name = meta.get("og:site_name")
+        og_url = meta.get("og:url") or url
+        og_image = meta.get("og:image")
+        og_video = meta.get("og:video")
 
-        message = og_description or og_title or self._extract_text_fallback(soup)
+        message = og_description or og_title or self._extract_text_fallback(tree)
         author_name = og_site_name
-        author_url = self._extract_author_url(soup) or self._infer_author_url_from_post_url(og_url)
-        author_id = self._derive_author_id(author_url)
+        linked_author_url, attached_post_url = self._classify_anchors(tree)
+        parsed_og_url = _parse_url(og_url)
+        author_url = linked_author_url or self._infer_author_url_from_post_url(parsed_og_url)
+        author_id = self._derive_author_id(_parse_url(author_url) if author_url else None)
 
-        post_id = self._extract_post_id_from_url(og_url) or self._hash_url(og_url)
+        post_id = self._extract_post_id_from_url(parsed_og_url) or self._hash_url(og_url)
 
         timestamp = now_timestamp()
-        comments_count = self._extract_int_from_html(soup, ["comments", "comment"])
-        reactions_count = self._extract_int_from_html(soup, ["likes", "reactions", "reacted"])
+        comments_count, reactions_count = self._extract_engagement_counts(
+            self._get_page_text(tree)
+        )
 
         record = PostRecord(
             post_id=post_id,
@@ -159,7 +434,7 @@ class FacebookPostsScraper:
             author=AuthorInfo(id=author_id, name=author_name, url=author_url),
             image=MediaInfo(url=og_image),
             video=MediaInfo(url=og_video),
-            attached_post_url=self._extract_attached_post_url(soup),
+            attached_post_url=attached_post_url,
         )
 
         return [record]
@@ -167,121 +442,158 @@ class FacebookPostsScraper:
     # ---------- Helper Methods ----------
 
     @staticmethod
-    def _get_meta_property(soup: BeautifulSoup, prop: str) -> Optional[str]:
-        tag = soup.find("meta", attrs={"property": prop}) or soup.find(
-            "meta", attrs={"name": prop}
-        )
-        if tag and tag.get("content"):
-            return tag["content"].strip()
-        return None
+    def _build_meta_index(tree: HtmlTree) -> Dict[str, str]:
+        """
+        Collect every <meta property=...> / <meta name=...> tag in a single pass.
+        The first non-empty occurrence of a key wins.
+        """
+        if isinstance(tree, BeautifulSoup):
+            attrs_iter = (tag.attrs for tag in tree.find_all("meta"))
+        elif _is_lxml_tree(tree):
+            attrs_iter = (el.attrib for el in tree.iter("meta"))
+        else:
+            attrs_iter = (node.attributes for node in tree.css("meta"))
+
+        index: Dict[str, str] = {}
+        for attrs in attrs_iter:
+            key = attrs.get("property") or attrs.get("name")
+            content = attrs.get("content")
+            if not key or not content or key in index:
+                continue
+            content = content.strip()
+            if content:
+                index[key] = content
+        return index
 
     @staticmethod
-    def _extract_text_fallback(soup: BeautifulSoup) -> Optional[str]:
+    def _extract_text_fallback(tree: HtmlTree) -> Optional[str]:
         # Fallback to the page title if nothing else is usable
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+        if isinstance(tree, BeautifulSoup):
+            title = tree.title.string if tree.title else None
+        elif _is_lxml_tree(tree):
+            title = tree.findtext(".//title")
+        else:
+            node = tree.css_first("title")
+            title = node.text() if node else None
+        if title and title.strip():
+            return title.strip()
         return None
 
     @staticmethod
-    def _extract_author_url(soup: BeautifulSoup) -> Optional[str]:
-        # Simple heuristic: look for profile links in header/avatar anchors
-        possible = soup.select("a[href*='facebook.com']")
-        for a in possible:
-            href = a.get("href")
-            if not href:
-                continue
-            if "profile.php" in href or "/pages/" in href:
-                return href
-        return None
+    def _iter_facebook_hrefs(tree: HtmlTree) -> Iterator[str]:
+        if isinstance(tree, BeautifulSoup):
+            for a in tree.select("a[href*='facebook.com']"):
+                href = a.get("href")
+                if href:
+                    yield href
+        elif _is_lxml_tree(tree):
+            # str() detaches the result from the tree so cached records don't pin it.
+            for href in tree.xpath("//a[contains(@href, 'facebook.com')]/@href"):
+                yield str(href)
+        else:
+            for node in tree.css("a[href*='facebook.com']"):
+                href = node.attributes.get("href")
+                if href:
+                    yield href
+
+    @classmethod
+    def _classify_anchors(cls, tree: HtmlTree) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Scan the page's Facebook links once and return (author_url, attached_post_url).
+
+        Author links are profile/page anchors (header/avatar); attached posts are links
+        that look like shared posts. Both heuristics are intentionally simple and conservative.
+        """
+        author_url: Optional[str] = None
+        attached_post_url: Optional[str] = None
+        for href in cls._iter_facebook_hrefs(tree):
+            if author_url is None and ("profile.php" in href or "/pages/" in href):
+                author_url = href
+            if attached_post_url is None and ("story_fbid=" in href or "/posts/" in href):
+                attached_post_url = href
+            if author_url is not None and attached_post_url is not None:
+                break
+        return author_url, attached_post_url
 
     @staticmethod
-    def _infer_author_url_from_post_url(post_url: str) -> Optional[str]:
+    def _infer_author_url_from_post_url(post_url: Optional[_ParsedUrl]) -> Optional[str]:
         """
         Infer a profile/page URL from a post URL if possible,
         e.g. https://www.facebook.com/somepage/posts/123 -> /somepage
         """
-        try:
-            parsed = urlparse(post_url)
-        except Exception:  # noqa: BLE001
-            return None
-
-        path_parts = [p for p in parsed.path.split("/") if p]
-        if not path_parts:
+        if post_url is None or not post_url.path_parts:
             return None
 
         # For URLs like /username/posts/ID -> take first segment as profile/page
-        return f"{parsed.scheme}://{parsed.netloc}/{path_parts[0]}"
+        return f"{post_url.scheme}://{post_url.netloc}/{post_url.path_parts[0]}"
 
     @staticmethod
-    def _derive_author_id(author_url: Optional[str]) -> Optional[str]:
-        if not author_url:
-            return None
-        try:
-            parsed = urlparse(author_url)
-            qs = parse_qs(parsed.query)
-            if "id" in qs and qs["id"]:
-                return qs["id"][0]
-        except Exception:  # noqa: BLE001
+    def _derive_author_id(author_url: Optional[_ParsedUrl]) -> Optional[str]:
+        if author_url is None:
             return None
+        author_id = author_url.query.get("id")
+        if author_id:
+            return author_id
         # Fallback: hashed URL
-        return hashlib.sha256(author_url.encode("utf-8")).hexdigest()[:16]
+        return FacebookPostsScraper._hash_url(author_url.url)
 
     @staticmethod
-    def _extract_post_id_from_url(post_url: str) -> Optional[str]:
-        try:
-            parsed = urlparse(post_url)
-            qs = parse_qs(parsed.query)
-
-            # Common pattern: story_fbid or fbid parameter
-            for key in ("story_fbid", "fbid"):
-                if key in qs and qs[key]:
-                    return qs[key][0]
-
-            # For paths that contain the ID as a segment
-            path_parts = [p for p in parsed.path.split("/") if p]
-            for part in reversed(path_parts):
-                if part.isdigit():
-                    return part
-        except Exception:  # noqa: BLE001
+    def _extract_post_id_from_url(post_url: Optional[_ParsedUrl]) -> Optional[str]:
+        if post_url is None:
             return None
+
+        # Common pattern: story_fbid or fbid parameter
+        for key in ("story_fbid", "fbid"):
+            if post_url.query.get(key):
+                return post_url.query[key]
+
+        # For paths that contain the ID as a segment
+        for part in reversed(post_url.path_parts):
+            if part.isdigit():
+                return part
         return None
 
     @staticmethod
     def _hash_url(url: str) -> str:
-        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        # Only used as a stable internal ID, so a fast non-cryptographic hash is enough.
+        return xxhash.xxh3_128_hexdigest(url.encode("utf-8"))[:16]
 
     @staticmethod
-    def _extract_int_from_html(soup: BeautifulSoup, keywords: List[str]) -> int:
+    def _get_page_text(tree: HtmlTree) -> str:
         """
-        Very lightweight heuristic to find integers near keywords like 'comments' or 'likes'.
+        Visible text of the page. Script/style/noscript tags are removed from the tree
+        in place, so this must run after the meta and anchor lookups.
         """
-        text = soup.get_text(" ", strip=True).lower()
-        best_value = 0
-        for kw in keywords:
-            idx = text.find(kw.lower())
-            if idx == -1:
-                continue
-            window = text[max(0, idx - 20) : idx + 20]
-            tokens = window.split()
-            for token in tokens:
-                token_clean = token.replace(",", "")
-                if token_clean.isdigit():
-                    try:
-                        value = int(token_clean)
-                    except ValueError:
-                        continue
-                    if value > best_value:
-                        best_value = value
-        return best_value
+        if isinstance(tree, BeautifulSoup):
+            for tag in tree.find_all(_NON_CONTENT_TAGS):
+                tag.decompose()
+            return tree.get_text(" ", strip=True)
+        if _is_lxml_tree(tree):
+            body = tree.find("body")
+            root_el = body if body is not None else tree
+            # Join text nodes individually: text_content() would glue adjacent elements
+            # together in minified markup ("Likes 10" + "3 reactions" -> "103 reactions").
+            texts = root_el.xpath(_LXML_VISIBLE_TEXT)
+            return " ".join(t.strip() for t in texts if t.strip())
+        tree.strip_tags(list(_NON_CONTENT_TAGS))
+        root = tree.body or tree.root
+        return root.text(separator=" ", strip=True) if root else ""
 
     @staticmethod
-    def _extract_attached_post_url(soup: BeautifulSoup) -> Optional[str]:
+    def _extract_engagement_counts(text: str) -> Tuple[int, int]:
         """
-        Attempt to find links that look like shared posts.
-        This is intentionally simple and conservative.
+        Very lightweight heuristic to find integers next to keywords like 'comments' or 'likes'.
+        Returns the largest (comments, reactions) counts found in a single scan of the text.
         """
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if "facebook.com" in href and ("story_fbid=" in href or "/posts/" in href):
-                return href
-        return None
\ No newline at end of file
+        comments = 0
+        reactions = 0
+        for raw_value, kind in _RE_ENGAGEMENT.findall(text):
+            digits = raw_value.replace(",", "")
+            if not digits.isdigit():
+                continue
+            value = int(digits)
+            if kind.lower().startswith("comment"):
+                comments = max(comments, value)
+            else:
+                reactions = max(reactions, value)
+        return comments, reactions
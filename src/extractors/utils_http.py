@@ -0,0 +1,107 @@
+import logging
+import random
+import threading
+import time
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+def backoff_delay(backoff_factor: float, attempt: int) -> float:
+    """
+    Exponential backoff with jitter for the given 1-based attempt number.
+
+    The jitter keeps concurrent workers from retrying a struggling host in lockstep.
+    """
+    return backoff_factor * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+class HTTPStatusError(RuntimeError):
+    """A response whose status code means the fetch should be retried."""
+
+    def __init__(self, status: int, url: str) -> None:
+        kind = "Server" if status >= 500 else "Client"
+        super().__init__(f"{status} {kind} Error for url: {url}")
+        self.status = status
+        self.url = url
+
+class CircuitOpenError(RuntimeError):
+    """Raised when requests to a host are short-circuited by an open breaker."""
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(f"Circuit open for {host}, retry in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """
+    Thread-safe, per-host circuit breaker.
+
+    After `failure_threshold` consecutive failures a host is OPEN and requests to it
+    are rejected. Once `recovery_window` seconds have passed the host becomes
+    HALF_OPEN and a single probe request is let through: success closes the
+    circuit again, failure re-opens it for another window.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_window: float = 30.0) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_window = recovery_window
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._states: Dict[str, str] = {}
+        self._opened_at: Dict[str, float] = {}
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._states.get(host, self.CLOSED)
+
+    def before_request(self, host: str) -> None:
+        """
+        Raise CircuitOpenError if a request to `host` should not be attempted yet.
+
+        The error's `retry_after` is how long until the breaker will let a probe through.
+        """
+        with self._lock:
+            state = self._states.get(host, self.CLOSED)
+            if state == self.CLOSED:
+                return
+            elapsed = time.monotonic() - self._opened_at[host]
+            if state == self.OPEN and elapsed >= self.recovery_window:
+                # Let exactly one probe through; the probe's outcome decides the next state.
+                self._states[host] = self.HALF_OPEN
+                self._opened_at[host] = time.monotonic()
+                logger.info("Circuit for %s is half-open, sending a probe request.", host)
+                return
+            if state == self.HALF_OPEN and elapsed >= self.recovery_window:
+                # The previous probe never reported back; allow another one.
+                self._opened_at[host] = time.monotonic()
+                return
+            retry_after = self.recovery_window - elapsed
+        raise CircuitOpenError(host, retry_after)
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            if self._states.get(host, self.CLOSED) != self.CLOSED:
+                logger.info("Circuit for %s closed again.", host)
+            self._failures.pop(host, None)
+            self._states.pop(host, None)
+            self._opened_at.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            state = self._states.get(host, self.CLOSED)
+            if state == self.HALF_OPEN or (
+                state == self.CLOSED and failures >= self.failure_threshold
+            ):
+                self._states[host] = self.OPEN
+                self._opened_at[host] = time.monotonic()
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failure(s); pausing for %.1fs.",
+                    host,
+                    failures,
+                    self.recovery_window,
+                )
@@ -1,12 +1,26 @@
 import logging
+import re
+import time
 from datetime import datetime, timezone
-from typing import Union
+from typing import Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# strptime fallbacks for inputs datetime.fromisoformat rejects (e.g. "+0000" offsets
+# before Python 3.11), ordered by how often they show up.
+_STRPTIME_FORMATS = (
+    (
+        re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:?\d{2})$"),
+        "%Y-%m-%dT%H:%M:%S%z",
+    ),
+    (re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$"), "%Y-%m-%dT%H:%M:%S"),
+    (re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r"\d{4}-\d{2}-\d{2}$"), "%Y-%m-%d"),
+)
+
 def now_timestamp() -> int:
     """Return the current UTC timestamp as an integer."""
-    return int(datetime.now(tz=timezone.utc).timestamp())
+    return int(time.time())
 
 def parse_timestamp(value: Union[int, float, str, datetime]) -> int:
     """
@@ -29,25 +43,31 @@ def parse_timestamp(value: Union[int, float, str, datetime]) -> int:
 
     if isinstance(value, str):
         stripped = value.strip()
-        # integer-like?
-        if stripped.isdigit():
+        # integer-like? (negative values are pre-1970 timestamps)
+        digits = stripped[1:] if stripped.startswith("-") else stripped
+        if digits.isdigit():
             return int(stripped)
 
-        # Try a few common date-time formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ]
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(stripped, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return int(dt.timestamp())
-            except ValueError:
-                continue
+        dt = _parse_datetime_string(stripped)
+        if dt is not None:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return int(dt.timestamp())
 
     logger.warning("Could not parse timestamp value %r, falling back to 'now'.", value)
-    return now_timestamp()
\ No newline at end of file
+    return now_timestamp()
+
+def _parse_datetime_string(value: str) -> Optional[datetime]:
+    # Fast path: fromisoformat is implemented in C and covers the usual ISO-8601 shapes.
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+
+    for pattern, fmt in _STRPTIME_FORMATS:
+        if pattern.match(value):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                return None
+    return None
\ No newline at end of file
@@ -5,6 +5,14 @@ from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Output is coalesced into 1 MiB writes instead of one write per record.
+NDJSON_BUFFER_SIZE = 1 << 20
+
 def ensure_parent_dir(path: Path) -> None:
     parent = path.parent
     if not parent.exists():
@@ -16,23 +24,35 @@ def export_posts_to_json(posts: List[Dict[str, Any]], output_path: Path) -> None
     """
     ensure_parent_dir(output_path)
     try:
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(posts, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with output_path.open("wb") as f:
+                f.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with output_path.open("w", encoding="utf-8") as f:
+                json.dump(posts, f, ensure_ascii=False, indent=2)
         logger.info("Exported %d post(s) to %s", len(posts), output_path)
     except OSError as exc:
         logger.error("Failed to write JSON output to %s: %s", output_path, exc)
         raise
 
+def dump_ndjson_line(post: Dict[str, Any]) -> bytes:
+    """
+    Serialize a single post as one UTF-8 encoded NDJSON line, including the trailing newline.
+    """
+    if orjson is not None:
+        return orjson.dumps(post, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(post, ensure_ascii=False) + "\n").encode("utf-8")
+
 def export_posts_to_ndjson(posts: List[Dict[str, Any]], output_path: Path) -> None:
     """
     Optionally export posts as newline-delimited JSON (one JSON object per line).
     """
     ensure_parent_dir(output_path)
     try:
-        with output_path.open("w", encoding="utf-8") as f:
-            for post in posts:
-                f.write(json.dumps(post, ensure_ascii=False) + "\n")
+        with output_path.open("wb", buffering=NDJSON_BUFFER_SIZE) as f:
+            # A generator keeps only one serialized line alive at a time.
+            f.writelines(dump_ndjson_line(post) for post in posts)
         logger.info("Exported %d post(s) to NDJSON file %s", len(posts), output_path)
     except OSError as exc:
         logger.error("Failed to write NDJSON output to %s: %s", output_path, exc)
-        raise
\ No newline at end of file
+        raise
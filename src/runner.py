@@ -1,14 +1,30 @@
 import argparse
+import asyncio
+import contextlib
 import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from extractors.async_scraper import AsyncFacebookPostsScraper
 from extractors.facebook_parser import FacebookPostsScraper
-from outputs.exporters import export_posts_to_json
+from extractors.utils_http import CircuitOpenError
+from outputs.exporters import (
+    NDJSON_BUFFER_SIZE,
+    dump_ndjson_line,
+    ensure_parent_dir,
+    export_posts_to_json,
+)
 from configparser import ConfigParser  # not used but kept for potential extension
 
+try:
+    from tqdm import tqdm
+    from tqdm.contrib.logging import logging_redirect_tqdm
+except ImportError:  # pragma: no cover - tqdm is optional
+    tqdm = None
+    logging_redirect_tqdm = None
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 DEFAULT_INPUT_FILE = ROOT_DIR / "data" / "inputs.sample.txt"
 DEFAULT_OUTPUT_FILE = ROOT_DIR / "data" / "sample.json"
@@ -40,13 +56,12 @@ def read_input_urls(path: Path) -> List[str]:
         logging.error("Input file %s does not exist.", path)
         return []
 
-    urls: List[str] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            urls.append(line)
+    data = path.read_text(encoding="utf-8")
+    urls = [
+        line
+        for line in map(str.strip, data.splitlines())
+        if line and not line.startswith("#")
+    ]
 
     if not urls:
         logging.warning("No URLs found in %s", path)
@@ -54,7 +69,11 @@ def read_input_urls(path: Path) -> List[str]:
         logging.info("Loaded %d URL(s) from %s", len(urls), path)
     return urls
 
-def build_scraper_from_settings(settings: Dict[str, Any]) -> FacebookPostsScraper:
+def build_scraper_from_settings(
+    settings: Dict[str, Any],
+    max_workers: int = 4,
+    use_async: bool = False,
+) -> FacebookPostsScraper:
     request_settings = settings.get("request", {})
     scraper_settings = settings.get("scraper", {})
     proxy_settings = settings.get("proxy", {})
@@ -62,8 +81,13 @@ def build_scraper_from_settings(settings: Dict[str, Any]) -> FacebookPostsScrape
     timeout = float(request_settings.get("timeout", 10.0))
     max_retries = int(request_settings.get("max_retries", 3))
     backoff_factor = float(request_settings.get("backoff_factor", 0.5))
+    breaker_threshold = int(request_settings.get("circuit_breaker_threshold", 5))
+    breaker_recovery = float(request_settings.get("circuit_breaker_recovery", 30.0))
+    breaker_max_wait = float(request_settings.get("circuit_breaker_max_wait", 120.0))
+    cache_size = int(scraper_settings.get("cache_size", 0))
 
     user_agent = str(scraper_settings.get("user_agent", "")).strip() or FacebookPostsScraper.DEFAULT_USER_AGENT
+    parser_backend = str(scraper_settings.get("parser", "selectolax")).strip() or "selectolax"
 
     proxies: Optional[Dict[str, str]] = None
     if proxy_settings:
@@ -73,14 +97,35 @@ def build_scraper_from_settings(settings: Dict[str, Any]) -> FacebookPostsScrape
             if isinstance(v, str) and v.strip()
         } or None
 
-    return FacebookPostsScraper(
+    scraper_cls = AsyncFacebookPostsScraper if use_async else FacebookPostsScraper
+    return scraper_cls(
         timeout=timeout,
         max_retries=max_retries,
         backoff_factor=backoff_factor,
         user_agent=user_agent,
         proxies=proxies,
+        parser_backend=parser_backend,
+        max_workers=max_workers,
+        circuit_breaker_threshold=breaker_threshold,
+        circuit_breaker_recovery=breaker_recovery,
+        circuit_breaker_max_wait=breaker_max_wait,
+        cache_size=cache_size,
     )
 
+def log_skipped_urls(logger: logging.Logger, skipped: int) -> None:
+    if skipped:
+        logger.warning(
+            "Skipped %d URL(s) whose host stayed unavailable past the circuit breaker wait.",
+            skipped,
+        )
+
+def dedupe_urls(urls: List[str]) -> List[str]:
+    """Drop repeated URLs while keeping the original order."""
+    unique = list(dict.fromkeys(urls))
+    if len(unique) < len(urls):
+        logging.info("Skipping %d duplicate URL(s).", len(urls) - len(unique))
+    return unique
+
 def scrape_urls(
     scraper: FacebookPostsScraper,
     urls: List[str],
@@ -91,6 +136,10 @@ def scrape_urls(
     if not urls:
         return results
 
+    urls = dedupe_urls(urls)
+
+    skipped = 0
+
     logger.info("Starting scrape of %d URL(s) with %d worker(s).", len(urls), max_workers)
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -107,9 +156,121 @@ def scrape_urls(
                     logger.info("Parsed %d post(s) from %s", len(posts), url)
                 else:
                     logger.warning("No posts parsed from %s", url)
+            except CircuitOpenError as exc:
+                skipped += 1
+                logger.warning("Skipped %s: %s", url, exc)
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Error while scraping %s: %s", url, exc)
 
+    log_skipped_urls(logger, skipped)
+    logger.info("Finished scraping. Total posts parsed: %d", len(results))
+    return results
+
+def stream_scrape_urls(
+    scraper: FacebookPostsScraper,
+    urls: List[str],
+    output_path: Path,
+    max_workers: int = 4,
+) -> int:
+    """
+    Scrape URLs and append each parsed post to an NDJSON file as soon as it is ready.
+
+    Memory stays proportional to the number of in-flight workers rather than the
+    total number of posts: results bypass the scraper's result cache and each
+    future is released once its posts are written. Returns the number of posts written.
+    """
+    logger = logging.getLogger("runner.stream_scrape_urls")
+    ensure_parent_dir(output_path)
+    urls = dedupe_urls(urls)
+    written = 0
+    skipped = 0
+
+    logger.info(
+        "Streaming scrape of %d URL(s) with %d worker(s) to %s.",
+        len(urls),
+        max_workers,
+        output_path,
+    )
+
+    # Route log records through tqdm.write so they don't tear up the progress bar.
+    progress_logging = (
+        logging_redirect_tqdm() if logging_redirect_tqdm is not None else contextlib.nullcontext()
+    )
+
+    with output_path.open("wb", buffering=NDJSON_BUFFER_SIZE) as out, ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor, progress_logging:
+        future_to_url = {
+            executor.submit(scraper.fetch_and_parse, url, use_cache=False): url for url in urls
+        }
+        completed = as_completed(future_to_url)
+        if tqdm is not None:
+            completed = tqdm(completed, total=len(future_to_url), unit="url")
+
+        # Only this thread writes, so the file handle needs no lock.
+        for future in completed:
+            # Popping drops the last reference to the future, freeing its result once written.
+            url = future_to_url.pop(future)
+            try:
+                posts = future.result()
+            except CircuitOpenError as exc:
+                skipped += 1
+                logger.warning("Skipped %s: %s", url, exc)
+                continue
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Error while scraping %s: %s", url, exc)
+                continue
+            if posts:
+                out.writelines(dump_ndjson_line(post) for post in posts)
+                written += len(posts)
+                logger.info("Parsed %d post(s) from %s", len(posts), url)
+            else:
+                logger.warning("No posts parsed from %s", url)
+
+    log_skipped_urls(logger, skipped)
+    logger.info("Finished scraping. Total posts written: %d", written)
+    return written
+
+async def scrape_urls_async(
+    scraper: AsyncFacebookPostsScraper,
+    urls: List[str],
+    max_workers: int = 4,
+) -> List[Dict[str, Any]]:
+    logger = logging.getLogger("runner.scrape_urls_async")
+    results: List[Dict[str, Any]] = []
+    if not urls:
+        return results
+
+    urls = dedupe_urls(urls)
+
+    logger.info("Starting async scrape of %d URL(s) with %d in flight.", len(urls), max_workers)
+    semaphore = asyncio.Semaphore(max_workers)
+    skipped = 0
+
+    async with scraper.create_session() as session:
+
+        async def scrape_one(url: str) -> List[Dict[str, Any]]:
+            nonlocal skipped
+            async with semaphore:
+                try:
+                    posts = await scraper.fetch_and_parse_async(session, url)
+                except CircuitOpenError as exc:
+                    skipped += 1
+                    logger.warning("Skipped %s: %s", url, exc)
+                    return []
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception("Error while scraping %s: %s", url, exc)
+                    return []
+            if posts:
+                logger.info("Parsed %d post(s) from %s", len(posts), url)
+            else:
+                logger.warning("No posts parsed from %s", url)
+            return posts
+
+        for posts in await asyncio.gather(*(scrape_one(url) for url in urls)):
+            results.extend(posts)
+
+    log_skipped_urls(logger, skipped)
     logger.info("Finished scraping. Total posts parsed: %d", len(results))
     return results
 
@@ -141,6 +302,17 @@ def parse_args() -> argparse.Namespace:
         default=4,
         help="Number of concurrent workers to use when scraping.",
     )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Fetch pages with asyncio/aiohttp instead of a thread pool.",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream posts to the output file as newline-delimited JSON while scraping.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -157,17 +329,28 @@ def main() -> None:
     config_file = Path(args.config_file)
 
     settings = load_settings(config_file)
-    scraper = build_scraper_from_settings(settings)
+    scraper_settings = settings.get("scraper", {})
+    max_workers = int(scraper_settings.get("concurrency", args.workers))
+    scraper = build_scraper_from_settings(
+        settings, max_workers=max_workers, use_async=args.use_async
+    )
 
     urls = read_input_urls(input_file)
     if not urls:
         logging.error("No URLs to process. Exiting.")
         return
 
-    scraper_settings = settings.get("scraper", {})
-    max_workers = int(scraper_settings.get("concurrency", args.workers))
+    if args.ndjson:
+        if args.use_async:
+            logging.warning("--ndjson streams from the thread pool; ignoring --async.")
+        stream_scrape_urls(scraper, urls, output_file, max_workers=max_workers)
+        logging.info("Done. Output written to %s", output_file)
+        return
 
-    posts = scrape_urls(scraper, urls, max_workers=max_workers)
+    if args.use_async:
+        posts = asyncio.run(scrape_urls_async(scraper, urls, max_workers=max_workers))
+    else:
+        posts = scrape_urls(scraper, urls, max_workers=max_workers)
 
     if not posts:
         logging.warning("No posts were scraped. Output file will contain an empty list.")
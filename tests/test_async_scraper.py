@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from extractors.async_scraper import AsyncFacebookPostsScraper
+from extractors.utils_http import CircuitBreaker, CircuitOpenError
+
+INVALID_UTF8_PAGE = (
+    b'<html><head><meta property="og:description" content="caf\xe9"></head>'
+    b"<body><p>2 comments</p></body></html>"
+)
+
+def _app(hits):
+    async def server_error(request):
+        hits["down"] += 1
+        return web.Response(status=503)
+
+    async def not_found(request):
+        hits["missing"] += 1
+        return web.Response(status=404)
+
+    async def bad_bytes(request):
+        return web.Response(body=INVALID_UTF8_PAGE, content_type="text/html", charset="utf-8")
+
+    app = web.Application()
+    app.router.add_get("/down", server_error)
+    app.router.add_get("/missing", not_found)
+    app.router.add_get("/posts/1", bad_bytes)
+    return app
+
+def _run(check):
+    async def main():
+        hits = {"down": 0, "missing": 0}
+        server = TestServer(_app(hits))
+        await server.start_server()
+        scraper = AsyncFacebookPostsScraper(
+            max_retries=2,
+            backoff_factor=0.0,
+            circuit_breaker_threshold=2,
+            circuit_breaker_max_wait=0,
+        )
+        try:
+            async with scraper.create_session() as session:
+                await check(scraper, session, server, hits)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+def test_async_server_errors_are_retried_and_trip_breaker():
+    async def check(scraper, session, server, hits):
+        url = str(server.make_url("/down"))
+        assert await scraper.fetch_and_parse_async(session, url) == []
+        assert hits["down"] == 2
+        assert scraper.circuit_breaker.state(f"{server.host}:{server.port}") == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            await scraper.fetch_and_parse_async(session, url)
+
+    _run(check)
+
+def test_async_client_errors_do_not_trip_breaker():
+    async def check(scraper, session, server, hits):
+        url = str(server.make_url("/missing"))
+        assert await scraper.fetch_and_parse_async(session, url) == []
+        assert await scraper.fetch_and_parse_async(session, url) == []
+        assert hits["missing"] == 4
+        host = f"{server.host}:{server.port}"
+        assert scraper.circuit_breaker.state(host) == CircuitBreaker.CLOSED
+
+    _run(check)
+
+def test_async_undecodable_bytes_are_replaced():
+    async def check(scraper, session, server, hits):
+        posts = await scraper.fetch_and_parse_async(session, str(server.make_url("/posts/1")))
+        assert len(posts) == 1
+        assert posts[0]["message"] == "caf�"
+        assert posts[0]["comments_count"] == 2
+
+    _run(check)
@@ -0,0 +1,58 @@
+import pytest
+
+from extractors import facebook_parser
+from extractors.facebook_parser import FacebookPostsScraper, _parse_url
+
+def test_post_id_prefers_story_fbid_over_fbid():
+    parsed = _parse_url("https://www.facebook.com/permalink.php?fbid=1&story_fbid=2")
+    assert FacebookPostsScraper._extract_post_id_from_url(parsed) == "2"
+
+def test_post_id_falls_back_to_last_numeric_path_segment():
+    parsed = _parse_url("https://www.facebook.com/20531316728/posts/10154009990506729/")
+    assert FacebookPostsScraper._extract_post_id_from_url(parsed) == "10154009990506729"
+
+def test_query_values_are_percent_decoded():
+    parsed = _parse_url("https://www.facebook.com/profile.php?id=100%2B200&story_fbid=12%2034")
+    assert FacebookPostsScraper._derive_author_id(parsed) == "100+200"
+    assert FacebookPostsScraper._extract_post_id_from_url(parsed) == "12 34"
+
+POST_URL = "https://www.facebook.com/examplepage/posts/12345"
+
+@pytest.mark.parametrize("backend", ["selectolax", "lxml", "bs4"])
+def test_adjacent_elements_are_not_glued_together(backend):
+    html = "<html><body><ul><li>Likes 10</li><li>3 reactions</li></ul></body></html>"
+    record = FacebookPostsScraper(parser_backend=backend)._parse_single_post_page(POST_URL, html)[0]
+    assert record.reactions_count == 3
+
+@pytest.mark.parametrize("backend", ["selectolax", "lxml", "bs4"])
+def test_script_style_and_noscript_text_is_ignored(backend):
+    html = (
+        "<html><body><p>5 likes</p><script>var x = '77 likes';</script>"
+        "<style>.a:after { content: '88 likes'; }</style><noscript>99 likes</noscript></body></html>"
+    )
+    record = FacebookPostsScraper(parser_backend=backend)._parse_single_post_page(POST_URL, html)[0]
+    assert record.reactions_count == 5
+
+@pytest.mark.parametrize("backend", ["selectolax", "lxml", "bs4"])
+@pytest.mark.parametrize("html", ["   \n", "<!-- nothing here -->"])
+def test_empty_documents_still_produce_a_record(backend, html):
+    records = FacebookPostsScraper(parser_backend=backend)._parse_single_post_page(POST_URL, html)
+    assert len(records) == 1
+    assert records[0].post_id == "12345"
+    assert records[0].reactions_count == 0
+
+def test_parsed_url_query_is_read_only():
+    parsed = _parse_url("https://www.facebook.com/profile.php?id=1")
+    with pytest.raises(TypeError):
+        parsed.query["id"] = "2"
+    assert _parse_url("https://www.facebook.com/profile.php?id=1").query["id"] == "1"
+
+def test_breaker_host_tolerates_malformed_urls():
+    assert FacebookPostsScraper._breaker_host("https://www.facebook.com/a") == "www.facebook.com"
+    assert FacebookPostsScraper._breaker_host("http://[::1") == "http://[::1"
+
+def test_cachetools_is_only_required_for_the_result_cache(monkeypatch):
+    monkeypatch.setattr(facebook_parser, "LRUCache", None)
+    assert FacebookPostsScraper()._results_cache is None
+    with pytest.raises(RuntimeError, match="cachetools"):
+        FacebookPostsScraper(cache_size=16)
@@ -0,0 +1,78 @@
+import itertools
+import json
+import logging
+import threading
+
+import requests
+
+from extractors.facebook_parser import FacebookPostsScraper
+from runner import scrape_urls, stream_scrape_urls
+
+HTML = (
+    '<html><head><meta property="og:description" content="Hello"></head>'
+    "<body><p>4 comments</p></body></html>"
+)
+
+def test_stream_scrape_urls_writes_ndjson_without_filling_the_cache(tmp_path, monkeypatch):
+    scraper = FacebookPostsScraper(cache_size=16)
+    monkeypatch.setattr(scraper, "_fetch_html_with_retries", lambda _url: HTML)
+    urls = [f"https://www.facebook.com/page/posts/{i}" for i in range(5)]
+    output = tmp_path / "posts.ndjson"
+
+    written = stream_scrape_urls(scraper, urls + urls[:2], output, max_workers=2)
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert written == len(lines) == 5
+    assert sorted(json.loads(line)["post_id"] for line in lines) == sorted(str(i) for i in range(5))
+    assert len(scraper._results_cache) == 0
+
+def _fake_get(statuses):
+    """Session.get stand-in that answers with the next status from `statuses`."""
+    lock = threading.Lock()
+
+    def get(url, **_kwargs):
+        with lock:
+            status = next(statuses)
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response._content = HTML.encode("utf-8")
+        return response
+
+    return get
+
+def test_scrape_urls_waits_out_a_short_outage(monkeypatch, caplog):
+    # Enough retries that no URL can exhaust them on the 503s alone: any URL lost
+    # here was dropped by the open circuit, which must not happen.
+    scraper = FacebookPostsScraper(
+        max_retries=8,
+        backoff_factor=0.0,
+        circuit_breaker_threshold=5,
+        circuit_breaker_recovery=0.2,
+    )
+    statuses = itertools.chain([503] * 6, itertools.repeat(200))
+    monkeypatch.setattr(scraper.session, "get", _fake_get(statuses))
+    urls = [f"https://www.facebook.com/page/posts/{i}" for i in range(200)]
+
+    with caplog.at_level(logging.INFO):
+        results = scrape_urls(scraper, urls, max_workers=4)
+
+    assert len(results) == 200
+    assert "is open, waiting" in caplog.text
+    assert "Skipped" not in caplog.text
+
+def test_scrape_urls_reports_urls_skipped_by_a_dead_host(monkeypatch, caplog):
+    scraper = FacebookPostsScraper(
+        max_retries=2,
+        backoff_factor=0.0,
+        circuit_breaker_threshold=2,
+        circuit_breaker_recovery=0.05,
+        circuit_breaker_max_wait=0.1,
+    )
+    monkeypatch.setattr(scraper.session, "get", _fake_get(itertools.repeat(503)))
+    urls = [f"https://www.facebook.com/page/posts/{i}" for i in range(20)]
+
+    with caplog.at_level(logging.WARNING):
+        assert scrape_urls(scraper, urls, max_workers=4) == []
+
+    assert "URL(s) whose host stayed unavailable" in caplog.text
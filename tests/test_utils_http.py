@@ -0,0 +1,125 @@
+import pytest
+import requests
+
+from extractors import facebook_parser, utils_http
+from extractors.facebook_parser import FacebookPostsScraper
+from extractors.utils_http import CircuitBreaker, CircuitOpenError
+
+HOST = "www.facebook.com"
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(utils_http.time, "monotonic", lambda: now[0])
+    return now
+
+def _open_breaker(threshold: int = 3, recovery_window: float = 30.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=threshold, recovery_window=recovery_window)
+    for _ in range(threshold):
+        breaker.before_request(HOST)
+        breaker.record_failure(HOST)
+    return breaker
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    for _ in range(2):
+        breaker.record_failure(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.CLOSED
+
+    breaker.record_failure(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.OPEN
+
+def test_success_resets_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure(HOST)
+    breaker.record_failure(HOST)
+    breaker.record_success(HOST)
+    breaker.record_failure(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.CLOSED
+
+def test_open_breaker_rejects_requests(clock):
+    breaker = _open_breaker()
+    clock[0] += 29.0
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request(HOST)
+    assert excinfo.value.retry_after == pytest.approx(1.0)
+    # Other hosts are unaffected.
+    breaker.before_request("example.com")
+
+def test_single_half_open_probe_after_recovery_window(clock):
+    breaker = _open_breaker()
+    clock[0] += 30.0
+
+    breaker.before_request(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+
+def test_probe_success_closes_breaker(clock):
+    breaker = _open_breaker()
+    clock[0] += 30.0
+    breaker.before_request(HOST)
+
+    breaker.record_success(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.CLOSED
+    breaker.before_request(HOST)
+
+def test_probe_failure_reopens_breaker(clock):
+    breaker = _open_breaker()
+    clock[0] += 30.0
+    breaker.before_request(HOST)
+
+    breaker.record_failure(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.OPEN
+    clock[0] += 29.0
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+
+def _response(status_code: int, url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response._content = b"<html></html>"
+    return response
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(facebook_parser.time, "sleep", lambda _delay: None)
+    return FacebookPostsScraper(
+        max_retries=2, circuit_breaker_threshold=2, circuit_breaker_max_wait=0
+    )
+
+def test_client_errors_do_not_trip_breaker(scraper, monkeypatch):
+    url = f"https://{HOST}/missing"
+    monkeypatch.setattr(scraper.session, "get", lambda *_a, **_kw: _response(404, url))
+
+    assert scraper._fetch_html_with_retries(url) is None
+    assert scraper._fetch_html_with_retries(url) is None
+    assert scraper.circuit_breaker.state(HOST) == CircuitBreaker.CLOSED
+
+def test_server_errors_trip_breaker(scraper, monkeypatch):
+    url = f"https://{HOST}/down"
+    monkeypatch.setattr(scraper.session, "get", lambda *_a, **_kw: _response(503, url))
+
+    assert scraper._fetch_html_with_retries(url) is None
+    assert scraper.circuit_breaker.state(HOST) == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        scraper._fetch_html_with_retries(url)
+
+def test_open_circuit_waits_for_recovery_window(clock, monkeypatch):
+    sleeps = []
+
+    def fake_sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(facebook_parser.time, "sleep", fake_sleep)
+    scraper = FacebookPostsScraper(max_retries=2, circuit_breaker_threshold=2)
+    url = f"https://{HOST}/flaky"
+    responses = iter([_response(503, url), _response(503, url), _response(200, url)])
+    monkeypatch.setattr(scraper.session, "get", lambda *_a, **_kw: next(responses))
+
+    assert scraper._fetch_html_with_retries(url) is None
+    assert scraper._fetch_html_with_retries(url) == "<html></html>"
+    assert sum(sleeps) >= 30.0
+    assert scraper.circuit_breaker.state(HOST) == CircuitBreaker.CLOSED
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+import pytest
+
+from extractors import utils_time
+from extractors.utils_time import parse_timestamp
+
+TS = 1704164645  # 2024-01-02T03:04:05Z
+NOW = 1234567890
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(utils_time, "now_timestamp", lambda: NOW)
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-02T03:04:05+00:00", TS),
+        ("2024-01-02T03:04:05", TS),
+        ("2024-01-02 03:04:05", TS),
+        ("2024-01-02", 1704153600),
+        ("2024-01-02T03:04:05Z", TS),
+        ("2024-01-02T03:04:05+0000", TS),
+        ("2024-01-02T05:04:05+0200", TS),
+        ("  2024-01-02T03:04:05Z  ", TS),
+        ("1704164645", TS),
+        ("-100", -100),
+        (TS, TS),
+        (1704164645.9, TS),
+        (datetime(2024, 1, 2, 3, 4, 5), TS),
+        ("garbage", NOW),
+        ("2024-13-45", NOW),
+        ("", NOW),
+    ],
+)
+def test_parse_timestamp(value, expected):
+    assert parse_timestamp(value) == expected
+
+class _NoIsoDatetime(datetime):
+    """datetime whose fromisoformat rejects everything, as pre-3.11 does for "+0000"."""
+
+    @classmethod
+    def fromisoformat(cls, value):
+        raise ValueError(value)
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-02T03:04:05+0000", TS),
+        ("2024-01-02T03:04:05Z", TS),
+        ("2024-01-02T05:04:05+02:00", TS),
+        ("2024-01-02 03:04:05", TS),
+        ("2024-01-02", 1704153600),
+        ("2024-01-02T99:04:05+0000", NOW),
+        ("garbage", NOW),
+    ],
+)
+def test_strptime_fallback(monkeypatch, value, expected):
+    monkeypatch.setattr(utils_time, "datetime", _NoIsoDatetime)
+    assert parse_timestamp(value) == expected